@@ -1,21 +1,96 @@
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import hmac
 import logging
 import os
 import time
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote_plus as _qp
 
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import h2  # noqa: F401  — required by httpx for http2=True
+    import httpx
+except ImportError:
+    httpx = None
 
 logger = logging.getLogger("tradebot.client")
 
 BASE_URL = "https://testnet.binancefuture.com"
 REQUEST_TIMEOUT = 10
 MAX_RETRIES = 3
+_RETRY_COUNT = MAX_RETRIES - 1
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+ORDER_RETRY_STATUS_CODES = (429,)
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+if httpx is not None:
+    _TIMEOUT_ERRORS: Tuple[type, ...] = (requests.exceptions.Timeout, httpx.TimeoutException)
+    _CONNECTION_ERRORS: Tuple[type, ...] = (requests.exceptions.ConnectionError, httpx.TransportError)
+else:
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    _CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+_TRANSPORT_ERRORS = _TIMEOUT_ERRORS + _CONNECTION_ERRORS
+
+_dotenvLoaded = False
+
+
+def _ensureDotenv() -> None:
+    global _dotenvLoaded
+    if _dotenvLoaded:
+        return
+    logger.debug("Loading environment variables from .env file")
+    load_dotenv()
+    _dotenvLoaded = True
+
+
+def _encodeParams(params: Dict[str, Any]) -> str:
+    parts = []
+    for k, v in params.items():
+        if v is None:
+            continue
+        if isinstance(v, (list, tuple)):
+            parts.extend(f"{k}={_qp(str(item))}" for item in v if item is not None)
+        else:
+            parts.append(f"{k}={_qp(str(v))}")
+    return "&".join(parts)
+
+
+def _http2Limits() -> "httpx.Limits":
+    return httpx.Limits(
+        max_connections=POOL_MAXSIZE,
+        max_keepalive_connections=POOL_MAXSIZE,
+    )
+
+
+def _retryDelay(resp: Any, attempt: int) -> float:
+    retryAfter = resp.headers.get("Retry-After")
+    if retryAfter is not None:
+        try:
+            return max(0.0, float(retryAfter))
+        except ValueError:
+            pass
+    return RETRY_BACKOFF_FACTOR * (2 ** (attempt - 1))
+
+
+def _bodyPreview(resp: Any, limit: int) -> str:
+    return resp.content[:limit].decode(resp.encoding or "utf-8", errors="replace")
+
+
+class _OrderSafeRetry(Retry):
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() not in self.allowed_methods:
+            return bool(self.total) and status_code in ORDER_RETRY_STATUS_CODES
+        return super().is_retry(method, status_code, has_retry_after)
 
 
 class BinanceAPIError(Exception):
@@ -28,14 +103,13 @@ class BinanceAPIError(Exception):
         )
 
 
-class BinanceClient:
+class _BaseBinanceClient(ABC):
     def __init__(
         self,
         apiKey: Optional[str] = None,
         apiSecret: Optional[str] = None,
     ):
-        logger.debug("Loading environment variables from .env file")
-        load_dotenv()
+        _ensureDotenv()
 
         self.apiKey = apiKey or os.getenv("BINANCE_TESTNET_API_KEY", "")
         self.apiSecret = apiSecret or os.getenv("BINANCE_TESTNET_API_SECRET", "")
@@ -48,122 +122,289 @@ class BinanceClient:
                 "in a .env file or as environment variables."
             )
 
-        logger.debug("API key loaded: %s...%s", self.apiKey[:4], self.apiKey[-4:])
-        logger.debug("API secret loaded: %s...%s", self.apiSecret[:4], self.apiSecret[-4:])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API key loaded: %s...%s", self.apiKey[:4], self.apiKey[-4:])
+            logger.debug("API secret loaded: %s...%s", self.apiSecret[:4], self.apiSecret[-4:])
+
+        try:
+            self._secretBytes = self.apiSecret.encode("ascii")
+        except UnicodeEncodeError:
+            logger.error("API secret contains non-ASCII characters")
+            raise EnvironmentError(
+                "Binance API secret is malformed: it must contain only ASCII characters. "
+                "Check BINANCE_TESTNET_API_SECRET in your .env file or environment."
+            ) from None
+
+        self._setupTransport()
+        logger.info("%s initialised — base URL: %s", type(self).__name__, BASE_URL)
 
-        self.session = requests.Session()
-        self.session.headers.update({
+    @abstractmethod
+    def _setupTransport(self) -> None:
+        ...
+
+    def _http2Headers(self) -> Dict[str, str]:
+        return {
             "X-MBX-APIKEY": self.apiKey,
             "Content-Type": "application/x-www-form-urlencoded",
-        })
-        logger.debug("HTTP session created with API key header")
-        logger.info("BinanceClient initialised — base URL: %s", BASE_URL)
+        }
 
-    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        params["timestamp"] = int(time.time() * 1000)
+    def _sign(self, params: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        params["timestamp"] = time.time_ns() // 1_000_000
         logger.debug("Added timestamp to params: %s", params["timestamp"])
-        queryString = urlencode(params)
+        queryString = _encodeParams(params)
         logger.debug("Query string for signing: %s", queryString)
-        signature = hmac.new(
-            self.apiSecret.encode("utf-8"),
-            queryString.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        signature = hmac.digest(
+            self._secretBytes, queryString.encode("ascii"), "sha256"
+        ).hex()
         params["signature"] = signature
-        logger.debug("Generated HMAC-SHA256 signature: %s...%s", signature[:8], signature[-8:])
-        return params
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated HMAC-SHA256 signature: %s...%s", signature[:8], signature[-8:])
+        return params, f"{queryString}&signature={signature}"
 
-    def _request(
+    def _doGet(self, url: str, queryString: str) -> Any:
+        if queryString:
+            url = f"{url}?{queryString}"
+        return self._get(url, timeout=REQUEST_TIMEOUT)
+
+    def _doHttp2Post(self, url: str, queryString: str) -> Any:
+        return self._post(url, content=queryString, timeout=REQUEST_TIMEOUT)
+
+    def _senderFor(self, method: str) -> Any:
+        sender = self._senders.get(method)
+        if sender is None:
+            logger.error("Unsupported HTTP method requested: %s", method)
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        return sender
+
+    def _prepareRequest(
         self,
         method: str,
         path: str,
-        params: Optional[Dict[str, Any]] = None,
-        signed: bool = False,
-    ) -> Dict[str, Any]:
-        params = dict(params or {})
+        params: Optional[Dict[str, Any]],
+        signed: bool,
+        owned: bool,
+    ) -> Tuple[str, str]:
+        if not owned or params is None:
+            params = dict(params or {})
         logger.info("Preparing %s request to %s", method, path)
         logger.debug("Raw params before signing: %s", params)
 
         if signed:
             logger.debug("Request requires signing — generating signature")
-            params = self._sign(params)
+            params, queryString = self._sign(params)
+        else:
+            queryString = _encodeParams(params)
 
         url = BASE_URL + path
         logger.info(">>> Sending %s %s", method, url)
         logger.debug(">>> Full params: %s", params)
+        return url, queryString
 
-        lastExc: Optional[Exception] = None
-        for attempt in range(1, MAX_RETRIES + 1):
-            logger.debug("Attempt %d/%d", attempt, MAX_RETRIES)
-            try:
-                resp = self.session.request(
-                    method,
-                    url,
-                    params=params if method == "GET" else None,
-                    data=urlencode(params) if method == "POST" else None,
-                    timeout=REQUEST_TIMEOUT,
-                )
-                logger.debug("Request succeeded on attempt %d", attempt)
-                break
-            except requests.exceptions.ConnectionError as exc:
-                lastExc = exc
-                logger.warning(
-                    "Connection error on attempt %d/%d: %s",
-                    attempt, MAX_RETRIES, exc,
-                )
-                if attempt < MAX_RETRIES:
-                    sleepTime = 1 * attempt
-                    logger.debug("Sleeping %ds before retry", sleepTime)
-                    time.sleep(sleepTime)
-            except requests.exceptions.Timeout as exc:
-                lastExc = exc
-                logger.warning(
-                    "Timeout on attempt %d/%d (timeout=%ds): %s",
-                    attempt, MAX_RETRIES, REQUEST_TIMEOUT, exc,
-                )
-                if attempt < MAX_RETRIES:
-                    sleepTime = 1 * attempt
-                    logger.debug("Sleeping %ds before retry", sleepTime)
-                    time.sleep(sleepTime)
+    def _logTransportError(self, exc: Exception) -> None:
+        if isinstance(exc, _TIMEOUT_ERRORS):
+            logger.error("Request failed (timeout=%ds): %s", REQUEST_TIMEOUT, exc)
         else:
-            logger.error("All %d request attempts failed — giving up", MAX_RETRIES)
-            raise lastExc
+            logger.error("Connection failed: %s", exc)
 
+    def _handleResponse(self, resp: Any) -> Dict[str, Any]:
         logger.info("<<< Response status: %d", resp.status_code)
-        logger.debug("<<< Response headers: %s", dict(resp.headers))
-        logger.debug("<<< Response body: %s", resp.text[:1000])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("<<< Response headers: %s", dict(resp.headers))
+            logger.debug("<<< Response body: %s", _bodyPreview(resp, 1000))
 
         try:
-            data = resp.json()
+            data = orjson.loads(resp.content)
             logger.debug("Response parsed as JSON successfully")
-        except ValueError:
-            logger.error("Failed to parse response as JSON: %s", resp.text[:500])
-            resp.raise_for_status()
+        except (orjson.JSONDecodeError, ValueError):
+            preview = _bodyPreview(resp, 500)
+            logger.error("Failed to parse response as JSON: %s", preview)
+            if resp.status_code >= 400:
+                raise BinanceAPIError(resp.status_code, resp.status_code, preview)
             return {}
 
         if resp.status_code >= 400 or (isinstance(data, dict) and "code" in data and data["code"] < 0):
             code = data.get("code", resp.status_code)
-            msg = data.get("msg", resp.text[:200])
+            msg = data["msg"] if "msg" in data else _bodyPreview(resp, 200)
             logger.error("Binance API returned error — HTTP %d, code=%s, msg=%s", resp.status_code, code, msg)
             raise BinanceAPIError(resp.status_code, code, msg)
 
         logger.debug("Request completed successfully")
         return data
 
+
+class BinanceClient(_BaseBinanceClient):
+    def __init__(
+        self,
+        apiKey: Optional[str] = None,
+        apiSecret: Optional[str] = None,
+        useHttp2: bool = False,
+    ):
+        self.useHttp2 = useHttp2
+        super().__init__(apiKey, apiSecret)
+
+    def _setupTransport(self) -> None:
+        if self.useHttp2:
+            if httpx is None:
+                logger.error("HTTP/2 transport requested but httpx[http2] is not installed")
+                raise ImportError(
+                    "useHttp2=True requires httpx with HTTP/2 support. "
+                    "Install it with: pip install 'httpx[http2]'"
+                )
+            self.session = self._createHttp2Client()
+            self._senders = {"GET": self._doGet, "POST": self._doHttp2Post}
+        else:
+            self.session = self._createSession()
+            self._senders = {"GET": self._doGet, "POST": self._doPost}
+        self._get = self.session.get
+        self._post = self.session.post
+
+    def _createSession(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=_OrderSafeRetry(
+                total=_RETRY_COUNT,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset(["GET"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.headers.update({
+            "X-MBX-APIKEY": self.apiKey,
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Connection": "keep-alive",
+        })
+        logger.debug("HTTP session created with API key header and pooled keep-alive adapter")
+        logger.debug(
+            "Retry policy: total=%d, backoff=%s, GET statuses=%s, POST statuses=%s",
+            _RETRY_COUNT, RETRY_BACKOFF_FACTOR, RETRY_STATUS_CODES, ORDER_RETRY_STATUS_CODES,
+        )
+        return session
+
+    def _createHttp2Client(self) -> "httpx.Client":
+        client = httpx.Client(
+            headers=self._http2Headers(),
+            timeout=REQUEST_TIMEOUT,
+            transport=httpx.HTTPTransport(http2=True, retries=_RETRY_COUNT, limits=_http2Limits()),
+        )
+        logger.debug("HTTP/2 client created with API key header (connect retries=%d)", _RETRY_COUNT)
+        return client
+
+    def _doPost(self, url: str, queryString: str) -> Any:
+        return self._post(url, data=queryString, timeout=REQUEST_TIMEOUT)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = False,
+        owned: bool = False,
+    ) -> Dict[str, Any]:
+        sender = self._senderFor(method)
+        url, queryString = self._prepareRequest(method, path, params, signed, owned)
+        try:
+            resp = sender(url, queryString)
+        except _TRANSPORT_ERRORS as exc:
+            self._logTransportError(exc)
+            raise
+        return self._handleResponse(resp)
+
     def get(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         signed: bool = False,
+        owned: bool = False,
     ) -> Dict[str, Any]:
         logger.debug("GET %s (signed=%s)", path, signed)
-        return self._request("GET", path, params, signed)
+        return self._request("GET", path, params, signed, owned)
 
     def post(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         signed: bool = True,
+        owned: bool = False,
     ) -> Dict[str, Any]:
         logger.debug("POST %s (signed=%s)", path, signed)
-        return self._request("POST", path, params, signed)
+        return self._request("POST", path, params, signed, owned)
+
+
+class AsyncBinanceClient(_BaseBinanceClient):
+    def _setupTransport(self) -> None:
+        if httpx is None:
+            logger.error("AsyncBinanceClient requested but httpx[http2] is not installed")
+            raise ImportError(
+                "AsyncBinanceClient requires httpx with HTTP/2 support. "
+                "Install it with: pip install 'httpx[http2]'"
+            )
+        self.session = httpx.AsyncClient(
+            headers=self._http2Headers(),
+            timeout=REQUEST_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(http2=True, retries=_RETRY_COUNT, limits=_http2Limits()),
+        )
+        logger.debug("Async HTTP/2 client created with API key header (connect retries=%d)", _RETRY_COUNT)
+        self._senders = {"GET": self._doGet, "POST": self._doHttp2Post}
+        self._get = self.session.get
+        self._post = self.session.post
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = False,
+        owned: bool = False,
+    ) -> Dict[str, Any]:
+        sender = self._senderFor(method)
+        url, queryString = self._prepareRequest(method, path, params, signed, owned)
+        retryStatuses = RETRY_STATUS_CODES if method == "GET" else ORDER_RETRY_STATUS_CODES
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                resp = await sender(url, queryString)
+            except _TRANSPORT_ERRORS as exc:
+                self._logTransportError(exc)
+                raise
+            if resp.status_code not in retryStatuses or attempt == MAX_RETRIES:
+                break
+            delay = _retryDelay(resp, attempt)
+            logger.warning(
+                "HTTP %d on attempt %d/%d — retrying in %.1fs",
+                resp.status_code, attempt, MAX_RETRIES, delay,
+            )
+            await asyncio.sleep(delay)
+        return self._handleResponse(resp)
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = False,
+        owned: bool = False,
+    ) -> Dict[str, Any]:
+        logger.debug("GET %s (signed=%s, async)", path, signed)
+        return await self._request("GET", path, params, signed, owned)
+
+    async def post(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = True,
+        owned: bool = False,
+    ) -> Dict[str, Any]:
+        logger.debug("POST %s (signed=%s, async)", path, signed)
+        return await self._request("POST", path, params, signed, owned)
+
+    async def aclose(self) -> None:
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncBinanceClient":
+        return self
+
+    async def __aexit__(self, *excInfo: Any) -> None:
+        await self.aclose()
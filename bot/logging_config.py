@@ -1,23 +1,35 @@
+from __future__ import annotations
+
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
 LOG_FILE = os.path.join(LOG_DIR, "tradebot.log")
 MAX_BYTES = 5 * 1024 * 1024
 BACKUP_COUNT = 3
+LOG_LEVEL_ENV = "TRADEBOT_LOG_LEVEL"
+DEFAULT_LOG_LEVEL = "INFO"
 
 _configured = False
+_listener: QueueListener | None = None
 
 
 def setupLogging() -> logging.Logger:
-    global _configured
+    global _configured, _listener
     logger = logging.getLogger("tradebot")
 
     if _configured:
         return logger
 
-    logger.setLevel(logging.DEBUG)
+    levelName = os.getenv(LOG_LEVEL_ENV, DEFAULT_LOG_LEVEL).strip().upper()
+    fileLevel = logging.getLevelName(levelName)
+    if not isinstance(fileLevel, int):
+        fileLevel = logging.getLevelName(DEFAULT_LOG_LEVEL)
+
+    logger.setLevel(min(fileLevel, logging.INFO))
 
     consoleHandler = logging.StreamHandler()
     consoleHandler.setLevel(logging.INFO)
@@ -28,7 +40,7 @@ def setupLogging() -> logging.Logger:
     fileHandler = RotatingFileHandler(
         LOG_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8"
     )
-    fileHandler.setLevel(logging.DEBUG)
+    fileHandler.setLevel(fileLevel)
     fileFmt = logging.Formatter(
         "%(asctime)s  %(levelname)-8s  [%(name)s]  %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -36,7 +48,21 @@ def setupLogging() -> logging.Logger:
     fileHandler.setFormatter(fileFmt)
 
     logger.addHandler(consoleHandler)
-    logger.addHandler(fileHandler)
+
+    logQueue: queue.Queue = queue.Queue(-1)
+    queueHandler = QueueHandler(logQueue)
+    queueHandler.setLevel(fileLevel)
+    logger.addHandler(queueHandler)
+    _listener = QueueListener(logQueue, fileHandler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stopLogging)
 
     _configured = True
     return logger
+
+
+def stopLogging() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-from bot.client import BinanceClient
+from bot.client import AsyncBinanceClient, BinanceClient
 from bot.validators import (
     validateOrderType,
     validatePrice,
@@ -16,16 +17,47 @@ logger = logging.getLogger("tradebot.orders")
 
 ORDER_ENDPOINT = "/fapi/v1/order"
 
+_REQUEST_TEMPLATE = (
+    "\n"
+    "┌─────────────────────────────────────────┐\n"
+    "│           ORDER REQUEST SUMMARY          │\n"
+    "├─────────────────────────────────────────┤\n"
+    "│  Symbol     : {symbol:<25s} │\n"
+    "│  Side       : {side:<25s} │\n"
+    "│  Type       : {orderType:<25s} │\n"
+    "│  Quantity   : {quantity!s:<25s} │\n"
+    "{pricePart}"
+    "└─────────────────────────────────────────┘\n"
+)
+_PRICE_LINE = "│  Price      : {price!s:<25s} │\n"
+
+_RESPONSE_TEMPLATE = (
+    "\n"
+    "┌─────────────────────────────────────────┐\n"
+    "│          ORDER RESPONSE DETAILS          │\n"
+    "├─────────────────────────────────────────┤\n"
+    "│  Order ID      : {orderId!s:<22s} │\n"
+    "│  Client OID    : {clientOrderId!s:<22s} │\n"
+    "│  Symbol        : {symbol!s:<22s} │\n"
+    "│  Side          : {side!s:<22s} │\n"
+    "│  Type          : {orderType!s:<22s} │\n"
+    "│  Status        : {status!s:<22s} │\n"
+    "│  Orig Qty      : {origQty!s:<22s} │\n"
+    "│  Executed Qty  : {executedQty!s:<22s} │\n"
+    "│  Avg Price     : {avgPrice!s:<22s} │\n"
+    "│  Price         : {price!s:<22s} │\n"
+    "│  Time in Force : {timeInForce!s:<22s} │\n"
+    "└─────────────────────────────────────────┘\n"
+)
 
-def placeOrder(
-    client: BinanceClient,
+
+def _buildOrderParams(
     symbol: str,
     side: str,
     orderType: str,
     quantity: float,
-    price: Optional[float] = None,
+    price: Optional[float],
 ) -> Dict[str, Any]:
-    logger.info("=== Starting order placement ===")
     logger.debug("Raw inputs — symbol=%s, side=%s, orderType=%s, quantity=%s, price=%s",
                  symbol, side, orderType, quantity, price)
 
@@ -54,17 +86,78 @@ def placeOrder(
         side, orderType, symbol, quantity, price,
     )
     logger.debug("Final API params: %s", params)
+    return params
 
-    logger.info("Sending order to Binance API endpoint: %s", ORDER_ENDPOINT)
-    response = client.post(ORDER_ENDPOINT, params=params, signed=True)
 
+def _logOrderResponse(response: Dict[str, Any]) -> None:
     logger.info("Order placed — orderId=%s, status=%s",
                 response.get("orderId", "N/A"), response.get("status", "N/A"))
     logger.debug("Full order response: %s", response)
+
+
+def placeOrder(
+    client: BinanceClient,
+    symbol: str,
+    side: str,
+    orderType: str,
+    quantity: float,
+    price: Optional[float] = None,
+) -> Dict[str, Any]:
+    logger.info("=== Starting order placement ===")
+    params = _buildOrderParams(symbol, side, orderType, quantity, price)
+
+    logger.info("Sending order to Binance API endpoint: %s", ORDER_ENDPOINT)
+    response = client.post(ORDER_ENDPOINT, params=params, signed=True, owned=True)
+
+    _logOrderResponse(response)
     logger.info("=== Order placement complete ===")
     return response
 
 
+async def placeOrderAsync(
+    client: AsyncBinanceClient,
+    symbol: str,
+    side: str,
+    orderType: str,
+    quantity: float,
+    price: Optional[float] = None,
+) -> Dict[str, Any]:
+    logger.info("=== Starting async order placement ===")
+    params = _buildOrderParams(symbol, side, orderType, quantity, price)
+
+    logger.info("Sending order to Binance API endpoint: %s", ORDER_ENDPOINT)
+    response = await client.post(ORDER_ENDPOINT, params=params, signed=True, owned=True)
+
+    _logOrderResponse(response)
+    logger.info("=== Async order placement complete ===")
+    return response
+
+
+async def placeOrdersConcurrently(
+    client: AsyncBinanceClient,
+    orders: Iterable[Dict[str, Any]],
+) -> List[Union[Dict[str, Any], Exception]]:
+    orders = list(orders)
+    logger.info("Placing basket of %d orders concurrently", len(orders))
+    results = await asyncio.gather(
+        *(placeOrderAsync(client, **order) for order in orders),
+        return_exceptions=True,
+    )
+    for result in results:
+        if not isinstance(result, Exception) and isinstance(result, BaseException):
+            raise result
+
+    failed = [
+        (index, result) for index, result in enumerate(results)
+        if isinstance(result, Exception)
+    ]
+    for index, exc in failed:
+        logger.error("Basket order #%d failed: %s", index, exc)
+    logger.info("Basket complete — %d placed, %d failed",
+                len(results) - len(failed), len(failed))
+    return list(results)
+
+
 def formatOrderRequest(
     symbol: str,
     side: str,
@@ -73,24 +166,11 @@ def formatOrderRequest(
     price: Optional[float],
 ) -> str:
     logger.debug("Formatting order request summary for display")
-    lines = [
-        "",
-        "┌─────────────────────────────────────────┐",
-        "│           ORDER REQUEST SUMMARY          │",
-        "├─────────────────────────────────────────┤",
-        f"│  Symbol     : {symbol:<25s} │",
-        f"│  Side       : {side:<25s} │",
-        f"│  Type       : {orderType:<25s} │",
-        f"│  Quantity   : {str(quantity):<25s} │",
-    ]
-    if price is not None:
-        lines.append(f"│  Price      : {str(price):<25s} │")
-    lines += [
-        "└─────────────────────────────────────────┘",
-        "",
-    ]
+    pricePart = _PRICE_LINE.format(price=price) if price is not None else ""
     logger.debug("Order request summary formatted")
-    return "\n".join(lines)
+    return _REQUEST_TEMPLATE.format(
+        symbol=symbol, side=side, orderType=orderType, quantity=quantity, pricePart=pricePart,
+    )
 
 
 def formatOrderResponse(resp: Dict[str, Any]) -> str:
@@ -110,24 +190,17 @@ def formatOrderResponse(resp: Dict[str, Any]) -> str:
     logger.debug("Extracted response fields — orderId=%s, status=%s, executedQty=%s, avgPrice=%s",
                  orderId, status, executedQty, avgPrice)
 
-    lines = [
-        "",
-        "┌─────────────────────────────────────────┐",
-        "│          ORDER RESPONSE DETAILS          │",
-        "├─────────────────────────────────────────┤",
-        f"│  Order ID      : {str(orderId):<22s} │",
-        f"│  Client OID    : {str(clientOrderId):<22s} │",
-        f"│  Symbol        : {str(symbol):<22s} │",
-        f"│  Side          : {str(side):<22s} │",
-        f"│  Type          : {str(orderType):<22s} │",
-        f"│  Status        : {str(status):<22s} │",
-        f"│  Orig Qty      : {str(origQty):<22s} │",
-        f"│  Executed Qty  : {str(executedQty):<22s} │",
-        f"│  Avg Price     : {str(avgPrice):<22s} │",
-        f"│  Price         : {str(price):<22s} │",
-        f"│  Time in Force : {str(timeInForce):<22s} │",
-        "└─────────────────────────────────────────┘",
-        "",
-    ]
     logger.debug("Order response formatted for display")
-    return "\n".join(lines)
+    return _RESPONSE_TEMPLATE.format(
+        orderId=orderId,
+        clientOrderId=clientOrderId,
+        symbol=symbol,
+        side=side,
+        orderType=orderType,
+        status=status,
+        origQty=origQty,
+        executedQty=executedQty,
+        avgPrice=avgPrice,
+        price=price,
+        timeInForce=timeInForce,
+    )
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import logging
+import re
 
 logger = logging.getLogger("tradebot.validators")
 
-VALID_SIDES = ("BUY", "SELL")
-VALID_ORDER_TYPES = ("MARKET", "LIMIT")
+_SIDE_NAMES = ("BUY", "SELL")
+_ORDER_TYPE_NAMES = ("MARKET", "LIMIT")
+VALID_SIDES = frozenset(_SIDE_NAMES)
+VALID_ORDER_TYPES = frozenset(_ORDER_TYPE_NAMES)
+
+_SYMBOL_RE = re.compile(r"[A-Z]+USDT")
+_UPPER = str.maketrans("abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
 
 
 def validateSymbol(symbol: str) -> str:
@@ -13,7 +19,10 @@ def validateSymbol(symbol: str) -> str:
     if not symbol or not isinstance(symbol, str):
         logger.error("Symbol validation failed: empty or not a string")
         raise ValueError("Symbol must be a non-empty string.")
-    symbol = symbol.strip().upper()
+    symbol = symbol.strip().translate(_UPPER)
+    if _SYMBOL_RE.fullmatch(symbol):
+        logger.debug("Symbol validated successfully: '%s'", symbol)
+        return symbol
     if not symbol.isalpha():
         logger.error("Symbol validation failed: non-alphabetic characters in '%s'", symbol)
         raise ValueError(f"Symbol must contain only letters, got: '{symbol}'")
@@ -25,8 +34,8 @@ def validateSymbol(symbol: str) -> str:
     if len(symbol) < 5:
         logger.error("Symbol validation failed: '%s' is too short", symbol)
         raise ValueError(f"Symbol too short: '{symbol}'")
-    logger.debug("Symbol validated successfully: '%s'", symbol)
-    return symbol
+    logger.error("Symbol validation failed: '%s' contains non-ASCII letters", symbol)
+    raise ValueError(f"Symbol must contain only letters A-Z, got: '{symbol}'")
 
 
 def validateSide(side: str) -> str:
@@ -36,8 +45,8 @@ def validateSide(side: str) -> str:
         raise ValueError("Side must be a non-empty string.")
     side = side.strip().upper()
     if side not in VALID_SIDES:
-        logger.error("Side validation failed: '%s' not in %s", side, VALID_SIDES)
-        raise ValueError(f"Side must be one of {VALID_SIDES}, got: '{side}'")
+        logger.error("Side validation failed: '%s' not in %s", side, _SIDE_NAMES)
+        raise ValueError(f"Side must be one of {_SIDE_NAMES}, got: '{side}'")
     logger.debug("Side validated successfully: '%s'", side)
     return side
 
@@ -49,9 +58,9 @@ def validateOrderType(orderType: str) -> str:
         raise ValueError("Order type must be a non-empty string.")
     orderType = orderType.strip().upper()
     if orderType not in VALID_ORDER_TYPES:
-        logger.error("Order type validation failed: '%s' not in %s", orderType, VALID_ORDER_TYPES)
+        logger.error("Order type validation failed: '%s' not in %s", orderType, _ORDER_TYPE_NAMES)
         raise ValueError(
-            f"Order type must be one of {VALID_ORDER_TYPES}, got: '{orderType}'"
+            f"Order type must be one of {_ORDER_TYPE_NAMES}, got: '{orderType}'"
         )
     logger.debug("Order type validated successfully: '%s'", orderType)
     return orderType